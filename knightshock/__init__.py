@@ -14,9 +14,12 @@ def format_mixture(mixture: str | dict) -> dict[str, float]:
         if ":" not in mixture:
             return {mixture.strip(): 1.0}
         else:
-            return dict(
-                (x.strip(), float(y))
-                for x, y in (element.split(":") for element in (mixture.split(",")))
-            )
+            try:
+                return {
+                    x.strip(): float(y)
+                    for x, y in (element.split(":") for element in mixture.split(","))
+                }
+            except ValueError:
+                raise ValueError(f"Invalid mixture '{mixture}'.") from None
     else:
         raise TypeError("Mixture argument must be str or dict.")
@@ -1,8 +1,97 @@
-from .constants import AVOGADRO_NUMBER, GAS_CONSTANT
+from .constants import BEER_LAMBERT_K
 
 import numpy as np
 import numpy.typing as npt
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Smallest array size evaluated with numexpr. Multithreaded numexpr breaks even with the NumPy implementation
+# between 5e3 and 5e4 elements, while single-threaded numexpr is slower up to about 1e7 elements, so numexpr is
+# only used with more than one thread
+_NUMEXPR_MIN_SIZE = 50_000
+
+_SCALAR_TYPES = (float, int, np.generic)
+
+
+def set_num_threads(n: int) -> int | None:
+    """Sets the number of threads used by `numexpr` when evaluating the Beer-Lambert law for large arrays. With a
+    single thread, the NumPy implementation is used instead.
+
+    Args:
+        n: Number of threads.
+
+    Returns:
+        Previous number of threads, or `None` if `numexpr` is not installed.
+
+    """
+    return ne.set_num_threads(n) if ne is not None else None
+
+
+def _all_scalars(a, b, T, P) -> bool:
+    """Returns whether all arguments are scalars, which are evaluated directly without any dispatch overhead."""
+    return (
+        isinstance(a, _SCALAR_TYPES)
+        and isinstance(b, _SCALAR_TYPES)
+        and isinstance(T, _SCALAR_TYPES)
+        and isinstance(P, _SCALAR_TYPES)
+    )
+
+
+def _use_numexpr(*args) -> bool:
+    """Returns whether the arguments are large enough floating point arrays to benefit from `numexpr`."""
+    if ne is None or ne.get_num_threads() < 2:
+        return False
+
+    arrays = [x for x in args if isinstance(x, np.ndarray)]
+    return (
+        len(arrays) > 0
+        and np.issubdtype(arrays[0].dtype, np.floating)
+        and all(x.dtype == arrays[0].dtype for x in arrays)
+        and max(x.size for x in arrays) >= _NUMEXPR_MIN_SIZE
+    )
+
+
+def _evaluate(expression: str, **operands) -> npt.NDArray[float]:
+    """Evaluates the expression with `numexpr` in the dtype of the array operands, casting scalar operands
+    since `numexpr` promotes the result to float64 for Python float constants."""
+    dtype = next(x.dtype for x in operands.values() if isinstance(x, np.ndarray))
+    return ne.evaluate(
+        expression,
+        local_dict={
+            name: x if isinstance(x, np.ndarray) else np.asarray(x, dtype=dtype)
+            for name, x in operands.items()
+        },
+    )
+
+
+def _beer_lambert_coeff(
+    T: float | npt.NDArray[float],
+    P: float | npt.NDArray[float],
+    L: float,
+) -> float | npt.NDArray[float]:
+    """Returns the coefficient relating absorbance to the product of cross-section and mole fraction,
+    allocating at most a single array."""
+    if np.isscalar(T) and np.isscalar(P):
+        return BEER_LAMBERT_K * L * P / T
+
+    coeff = np.divide(P, T)
+    coeff *= BEER_LAMBERT_K * L
+    return coeff
+
+
+def _empty_like_broadcast(*args) -> npt.NDArray[float]:
+    """Returns an uninitialized output array with the broadcast shape and result dtype of the arguments."""
+    # Array-likes such as lists are converted, while Python scalars are kept as is so that they do not
+    # promote the result dtype
+    args = [x if np.isscalar(x) else np.asarray(x) for x in args]
+    return np.empty(
+        np.broadcast_shapes(*(np.shape(x) for x in args)),
+        dtype=np.result_type(*args, BEER_LAMBERT_K),
+    )
+
 
 def absorbance(
     X: float | npt.NDArray[float],
@@ -24,7 +113,24 @@ def absorbance(
         A: Absorbance.
 
     """
-    return sigma * X * AVOGADRO_NUMBER * L * P / (GAS_CONSTANT * T) / 1e6
+    if _all_scalars(X, sigma, T, P):
+        return sigma * X * BEER_LAMBERT_K * L * P / T
+
+    if _use_numexpr(X, sigma, T, P):
+        return _evaluate(
+            "sigma * X * K * L * P / T",
+            sigma=sigma,
+            X=X,
+            K=BEER_LAMBERT_K,
+            L=L,
+            P=P,
+            T=T,
+        )
+
+    coeff = _beer_lambert_coeff(T, P, L)
+    out = np.multiply(sigma, X, out=_empty_like_broadcast(sigma, X, coeff))
+    out *= coeff
+    return out[()]  # 0-d arrays are returned as NumPy scalars
 
 
 def absorption_cross_section(
@@ -47,8 +153,18 @@ def absorption_cross_section(
         sigma: Absorption cross-section [cm^2^].
 
     """
+    if _all_scalars(A, X, T, P):
+        return A / (X * BEER_LAMBERT_K * L * P / T)
 
-    return A / (X * AVOGADRO_NUMBER * L * P / (GAS_CONSTANT * T)) * 1e6
+    if _use_numexpr(A, X, T, P):
+        return _evaluate(
+            "A / (X * K * L * P / T)", A=A, X=X, K=BEER_LAMBERT_K, L=L, P=P, T=T
+        )
+
+    coeff = _beer_lambert_coeff(T, P, L)
+    out = np.multiply(X, coeff, out=_empty_like_broadcast(A, X, coeff))
+    np.divide(A, out, out=out)
+    return out[()]
 
 
 def species_mole_fraction(
@@ -71,8 +187,47 @@ def species_mole_fraction(
         X: Species mole fraction.
 
     """
+    if _all_scalars(A, sigma, T, P):
+        return A / (sigma * BEER_LAMBERT_K * L * P / T)
+
+    if _use_numexpr(A, sigma, T, P):
+        return _evaluate(
+            "A / (sigma * K * L * P / T)",
+            A=A,
+            sigma=sigma,
+            K=BEER_LAMBERT_K,
+            L=L,
+            P=P,
+            T=T,
+        )
 
-    return A / (sigma * AVOGADRO_NUMBER * L * P / (GAS_CONSTANT * T)) * 1e6
+    coeff = _beer_lambert_coeff(T, P, L)
+    out = np.multiply(sigma, coeff, out=_empty_like_broadcast(A, sigma, coeff))
+    np.divide(A, out, out=out)
+    return out[()]
+
+
+def _check_singular(det: float | npt.NDArray[float]):
+    """Raises `LinAlgError` for singular matrices, consistent with `np.linalg.solve`."""
+    if np.any(det == 0):
+        raise np.linalg.LinAlgError("Singular matrix")
+
+
+def _solve_2x2(a: npt.NDArray[float], b: npt.NDArray[float]) -> npt.NDArray[float]:
+    """Solves `a x = b` for 2x2 systems using Cramer's rule, where the matrix axes of `a` and the
+    vector axis of `b` are the leading axes."""
+    (a00, a01), (a10, a11) = a
+
+    det = a00 * a11 - a01 * a10
+    _check_singular(det)
+
+    x = np.empty(
+        (2,) + np.broadcast_shapes(np.shape(det), b.shape[1:]),
+        dtype=np.result_type(det, b),
+    )
+    x[0] = (a11 * b[0] - a01 * b[1]) / det
+    x[1] = (a00 * b[1] - a10 * b[0]) / det
+    return x
 
 
 def multi_species_mole_fraction(
@@ -87,40 +242,53 @@ def multi_species_mole_fraction(
 
     Calculates the mole fractions of `N` species from absorbance data at `N` wavelengths given absorption
     cross-sections for each species at each wavelength. For mole fraction time histories, absorption cross-sections,
-    temperature, and pressure can be constant or varying with time.
+    temperature, and pressure can be constant or varying with time; time must be the last axis of all time
+    history arrays.
 
     Args:
-        A: Absorbance at each wavelength `(N, ...)`.
-        sigma: Species absorption cross-sections [cm^2] at each wavelength `(N, N, ...)`.
-        T: Absolute temperature [K].
-        P: Absolute pressure [Pa].
+        A: Absorbance at each wavelength `(N,)` or `(N, t)`.
+        sigma: Species absorption cross-sections [cm^2] at each wavelength `(N, N)` or `(N, N, t)`.
+        T: Absolute temperature [K], scalar or `(t,)`.
+        P: Absolute pressure [Pa], scalar or `(t,)`.
         L: Path length [cm].
 
     Returns:
-        X: Species mole fractions `(N, ...)`.
+        X: Species mole fractions `(N,)` or `(N, t)`.
 
     """
     A = np.asarray(A)
     sigma = np.asarray(sigma)
-    T = np.asarray(T)
-    P = np.asarray(P)
+    coeff = np.asarray(_beer_lambert_coeff(np.asarray(T), np.asarray(P), L))
 
     if A.ndim == 1:
-        assert sigma.ndim == 2 and T.shape == (1,) and P.shape == (1,)
-    elif A.ndim == 2:
-        # For absorbance time histories, the arrays must be reshaped so that time is the outer
-        # axis, as the NumPy linear algebra routines operate on the inner matrices
+        assert sigma.ndim == 2 and coeff.size == 1
+
+    # Scaling the absorbance by the inverse coefficient is equivalent to scaling the cross-section
+    # matrices and avoids materializing a scaled copy of the matrices before solving
+    N = A.shape[0]
+
+    # Two-species systems are solved in closed form directly in the time-last layout, which avoids the
+    # per-matrix overhead of the LAPACK routines; for larger systems, the unpivoted closed forms lose
+    # accuracy much faster than LU factorization as overlapping spectra make the matrices ill-conditioned
+    if N == 2:
+        return _solve_2x2(sigma, np.divide(A, coeff))
 
-        A = np.moveaxis(A, -1, 0)
-        if sigma.ndim == 3:
-            sigma = np.moveaxis(sigma, -1, 0)
-        else:
-            sigma = np.broadcast_to(sigma, (A.shape[0],) + sigma.shape)
+    # Constant cross-sections are factored once and solved with each time step of the absorbance as
+    # a column of the right-hand side
+    if sigma.ndim == 2:
+        return np.ascontiguousarray(np.linalg.solve(sigma, np.divide(A, coeff)))
 
-    X = np.linalg.solve(sigma / 1e6 * AVOGADRO_NUMBER * P / (GAS_CONSTANT * T) * L, A)
+    # Time-varying cross-sections and absorbances are copied into time-major buffers, as the NumPy
+    # linear algebra routines operate on the inner matrices and read them sequentially from
+    # contiguous memory
+    n_t = A.shape[1]
+    b = np.divide(A.T, coeff.reshape(coeff.shape + (1,)), order="C")
+    sigma_buf = np.empty((n_t, N, N), dtype=np.result_type(sigma, b))
+    sigma_buf[:] = np.moveaxis(sigma, -1, 0)
 
-    # For absorbance time histories, reshape the array so that time is the inner axis
-    if X.ndim == 2:
-        np.moveaxis(X, 0, 1)
+    # The absorbance is passed as a stack of column vectors, since NumPy 2 no longer infers stacked
+    # vectors from the number of dimensions
+    X = np.linalg.solve(sigma_buf, b[..., np.newaxis])[..., 0]
 
-    return X
+    # Reshape the array so that time is the inner axis
+    return np.ascontiguousarray(X.T)
@@ -3,3 +3,6 @@ AVOGADRO_NUMBER = 6.02214076e23
 
 GAS_CONSTANT = 8.31432e3
 """Universal gas constant [J mol^-1^ K^-1^]."""
+
+BEER_LAMBERT_K = AVOGADRO_NUMBER / (GAS_CONSTANT * 1e6)
+"""Beer-Lambert law constant for absorption cross-sections [cm^2^], pressures [Pa], and path lengths [cm]."""
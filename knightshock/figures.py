@@ -4,6 +4,25 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 
 
+def _inverse_temperature(T: int | float | npt.ArrayLike) -> npt.NDArray[float]:
+    """Returns 1000/T, converting and inverting the temperatures in a single array."""
+    x = np.array(T, dtype=float)
+    np.divide(1000, x, out=x)
+    return x
+
+
+def _merge_props(*props: dict) -> dict:
+    """Merges property dicts in order of precedence, skipping the merge when only one is non-empty."""
+    props = [p for p in props if p]
+    if len(props) == 1:
+        return props[0]
+
+    merged = {}
+    for p in props:
+        merged |= p
+    return merged
+
+
 class IDTFigure:
     """Class for creating ignition delay time figures with the standard layout:
 
@@ -46,7 +65,8 @@ class IDTFigure:
         """
 
         if ax is None:
-            _, self.ax = plt.subplots()
+            _, ax = plt.subplots()
+        self.ax = ax
 
         def convert(x):
             return 1000 / x
@@ -85,18 +105,18 @@ class IDTFigure:
             uncertainty: Experimental uncertainty as a fraction of `IDT` (optional).
 
         """
-        T = np.asarray(T)
-        IDT = np.asarray(IDT)
+        inv_T = _inverse_temperature(T)
+        IDT = np.asarray(IDT, dtype=float)
 
         if uncertainty == 0:
-            c = self.ax.scatter(1000 / T, IDT, **(self.exp_props | kwargs))
+            c = self.ax.scatter(inv_T, IDT, **_merge_props(self.exp_props, kwargs))
             self.exp_handles.append(c)
         else:
             c = self.ax.errorbar(
-                1000 / T,
+                inv_T,
                 IDT,
                 yerr=uncertainty * IDT,
-                **(self.exp_props | self.error_props | kwargs)
+                **_merge_props(self.exp_props, self.error_props, kwargs)
             )
             self.exp_handles.append(c[0])
 
@@ -113,8 +133,10 @@ class IDTFigure:
             IDT: Ignition delay times [[`units`][knightshock.figures.IDTFigure.units]].
 
         """
-        T = np.asarray(T)
-        (ln,) = self.ax.plot(1000 / T, IDT, **(self.sim_props | kwargs))
+        IDT = np.asarray(IDT, dtype=float)
+        (ln,) = self.ax.plot(
+            _inverse_temperature(T), IDT, **_merge_props(self.sim_props, kwargs)
+        )
 
         self.sim_handles.append(ln)
         self.sim_labels.append(kwargs["label"] if "label" in kwargs else None)
@@ -12,10 +12,14 @@ class Simulation:
         gas: Cantera `Solution` object.
         reactor: Cantera `Reactor` object.
         reactor_net: Cantera `ReactorNet` object.
-        states: Cantera `SolutionArray` object.
 
     """
 
+    _initial_capacity: int = 1024
+    _dt_rtol: float = 1e-9
+    """Relative tolerance (as a fraction of `dt`) below which the final partial interval in `run` is merged
+    into the previous one, so that floating point error in `t / dt` does not record an extra, tiny interval."""
+
     def __init__(
         self,
         gas: ct.Solution | str,
@@ -24,6 +28,7 @@ class Simulation:
         X: str | dict[str, float],
         *,
         reactor: ct.Reactor | Type[ct.Reactor] = ct.Reactor,
+        capture: str = "full",
     ):
         """
 
@@ -33,9 +38,20 @@ class Simulation:
             P: Pressure [Pa].
             X: Species mole fractions.
             reactor: Cantera reactor object or subclass (optional).
+            capture:
+                Reactor state history recorded at each time step (optional).
+
+                  - 'full' state (required for species mole fractions and `states`)
+
+                  - 'scalars' (time, temperature, and pressure only)
 
         """
 
+        if capture not in ("full", "scalars"):
+            raise ValueError(
+                f"Invalid capture '{capture}'; valid options are 'full' and 'scalars'."
+            )
+
         self.gas = gas if isinstance(gas, ct.Solution) else ct.Solution(gas)
         self.gas.TPX = T, P, X
 
@@ -58,41 +74,111 @@ class Simulation:
             ) from None
 
         self.reactor_net = ct.ReactorNet([self.reactor])
-        self.states = ct.SolutionArray(self.gas, extra=["t"])
 
-        self.states.append(self.reactor.thermo.state, t=0)  # Add initial state
+        # Reactor states are recorded in preallocated arrays that grow geometrically, and the
+        # `SolutionArray` is only constructed from them when accessed
+        self._capture = capture
+        self._n = 0
+        self._history = {
+            "t": np.empty(self._initial_capacity),
+            "T": np.empty(self._initial_capacity),
+            "P": np.empty(self._initial_capacity),
+        }
+        if capture == "full":
+            self._history["Y"] = np.empty((self._initial_capacity, self.gas.n_species))
+        self._states = None
+        self._species_rank = None
+
+        self._store_state()  # Add initial state
+
+    def _store_state(self):
+        """Records the current reactor state, doubling the capacity of the history arrays when full."""
+        if self._n == len(self._history["t"]):
+            for key, value in self._history.items():
+                self._history[key] = np.resize(
+                    value, (2 * len(value),) + value.shape[1:]
+                )
+
+        thermo = self.reactor.thermo
+        self._history["t"][self._n] = self.reactor_net.time
+        self._history["T"][self._n] = thermo.T
+        self._history["P"][self._n] = thermo.P
+        if self._capture == "full":
+            self._history["Y"][self._n] = thermo.Y
+
+        self._n += 1
+        self._states = None
+        self._species_rank = None
 
     def run(
         self,
         t: float = 10e-3,
+        *,
+        dt: float | None = None,
     ):
         """
         Args:
             t: Simulation end time [s] (optional).
+            dt: Interval between recorded reactor states [s] (optional). States are recorded at multiples of `dt`
+                from the current time and at the end time `t`. By default, the state is recorded after every
+                internal integrator time step.
 
         """
-        i = 0
-        while self.reactor_net.time < t:
-            self.reactor_net.step()
-            self.states.append(self.reactor.thermo.state, t=self.reactor_net.time)
-            i += 1
+        if dt is not None and not dt > 0:
+            raise ValueError(f"Invalid dt '{dt}'; dt must be positive.")
+
+        if dt is None:
+            while self.reactor_net.time < t:
+                self.reactor_net.step()
+                self._store_state()
+        else:
+            # The integrator takes as many internal time steps between recorded states as needed
+            t0 = self.reactor_net.time
+            n = int(np.ceil((t - t0) / dt - self._dt_rtol))
+            for t_i in np.append(t0 + dt * np.arange(1, n), t) if n > 0 else []:
+                self.reactor_net.advance(t_i)
+                self._store_state()
 
         return self
 
+    def _history_view(self, key: str) -> np.ndarray[float]:
+        """View of the recorded history for `key` for internal use; the public properties return copies."""
+        return self._history[key][: self._n]
+
+    @property
+    def states(self) -> ct.SolutionArray:
+        """Cantera `SolutionArray` object of the reactor state history."""
+        if self._capture != "full":
+            raise AttributeError(
+                "Reactor states are only recorded for simulations with capture='full'."
+            )
+
+        if self._states is None:
+            self._states = ct.SolutionArray(
+                self.gas, shape=self._n, extra={"t": self.t}
+            )
+            self._states.TPY = (
+                self._history_view("T"),
+                self._history_view("P"),
+                self._history_view("Y"),
+            )
+
+        return self._states
+
     @property
     def t(self) -> np.ndarray[float]:
         """Reactor elapsed time [s]."""
-        return self.states.t
+        return self._history_view("t").copy()
 
     @property
     def T(self) -> np.ndarray[float]:
         """Reactor temperature history [K]."""
-        return self.states.T
+        return self._history_view("T").copy()
 
     @property
     def P(self) -> np.ndarray[float]:
         """Reactor pressure history [Pa]."""
-        return self.states.P
+        return self._history_view("P").copy()
 
     def X(self, species: str) -> np.ndarray[float]:
         """
@@ -102,7 +188,7 @@ class Simulation:
             species: Name of species.
 
         """
-        return self.states(species).X.flatten()
+        return self.states(species).X.ravel()
 
     def ignition_delay_time(
         self, species: str = None, *, method: str = "inflection"
@@ -129,13 +215,17 @@ class Simulation:
 
         """
 
-        x = self.T if species is None else self.X(species)
+        t = self._history_view("t")
+        x = self._history_view("T") if species is None else self.X(species)
         if method == "inflection":
-            i = np.argmax(np.diff(x) / np.diff(self.t))
-            return self.t[i] if i != len(self.t) - 2 else np.nan
+            # The slope is computed in place to avoid a temporary for each difference
+            slope = np.subtract(x[1:], x[:-1])
+            slope /= np.subtract(t[1:], t[:-1])
+            i = np.argmax(slope)
+            return t[i] if i != len(t) - 2 else np.nan
         elif method == "peak":
             i = np.argmax(x)
-            return self.t[i] if i != len(self.t) - 1 else np.nan
+            return t[i] if i != len(t) - 1 else np.nan
         else:
             raise ValueError(
                 f"Invalid method '{method}'; valid methods are 'inflection' and 'peak'."
@@ -157,18 +247,17 @@ class Simulation:
 
         """
 
-        X_max = np.max(self.states.X.T, axis=1)
-        species = [
-            t[1] for t in sorted(zip(X_max, self.states.species_names), reverse=True)
-        ]
-
-        if exclude is not None:
-            if isinstance(exclude, str):
-                exclude = [exclude]
-            for s in exclude:
-                try:
-                    species.remove(s.upper())
-                except ValueError:
-                    pass
-
-        return species[:n]
+        if exclude is None:
+            exclude = set()
+        elif isinstance(exclude, str):
+            exclude = {exclude.upper()}
+        else:
+            exclude = {s.upper() for s in exclude}
+
+        # The ranking of all species is cached until more states are recorded
+        if self._species_rank is None:
+            X_max = self.states.X.max(axis=0)
+            names = np.asarray(self.states.species_names)
+            self._species_rank = names[np.argsort(-X_max, kind="stable")].tolist()
+
+        return [s for s in self._species_rank if s not in exclude][:n]
@@ -0,0 +1,176 @@
+import numpy as np
+import pytest
+
+from knightshock import absorption
+from knightshock.absorption import (
+    absorbance,
+    absorption_cross_section,
+    multi_species_mole_fraction,
+    species_mole_fraction,
+)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("size", [10, absorption._NUMEXPR_MIN_SIZE])
+def test_beer_lambert_preserves_dtype(dtype, size):
+    X = np.linspace(0.01, 0.02, size, dtype=dtype)
+    sigma = dtype(1e-19)
+    T = dtype(1500)
+    P = np.full(size, 1e5, dtype=dtype)
+
+    A = absorbance(X, sigma, T, P, 10)
+    assert A.dtype == dtype
+    assert species_mole_fraction(A, sigma, T, P, 10).dtype == dtype
+    assert absorption_cross_section(A, X, T, P, 10).dtype == dtype
+    np.testing.assert_allclose(species_mole_fraction(A, sigma, T, P, 10), X, rtol=1e-5)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_beer_lambert_numexpr(monkeypatch, dtype):
+    pytest.importorskip("numexpr")
+    X = np.linspace(0.01, 0.02, 100, dtype=dtype)
+    T = np.linspace(1000, 2000, 100, dtype=dtype)
+    expected = (
+        absorbance(X, 1e-19, T, 1e5, 10),
+        species_mole_fraction(X, 1e-19, T, 1e5, 10),
+        absorption_cross_section(X, X, T, 1e5, 10),
+    )
+
+    calls = []
+    evaluate = absorption._evaluate
+
+    def spy(expression, **operands):
+        calls.append(expression)
+        return evaluate(expression, **operands)
+
+    monkeypatch.setattr(absorption, "_NUMEXPR_MIN_SIZE", 1)
+    monkeypatch.setattr(absorption.ne, "get_num_threads", lambda: 2)
+    monkeypatch.setattr(absorption, "_evaluate", spy)
+    results = (
+        absorbance(X, 1e-19, T, 1e5, 10),
+        species_mole_fraction(X, 1e-19, T, 1e5, 10),
+        absorption_cross_section(X, X, T, 1e5, 10),
+    )
+
+    assert len(calls) == 3
+    rtol = 1e-6 if dtype == np.float32 else 1e-14
+    for result, value in zip(results, expected):
+        assert result.dtype == dtype
+        np.testing.assert_allclose(result, value, rtol=rtol)
+
+
+def test_beer_lambert_0d_arrays_return_scalars():
+    A = absorbance(np.array(0.01), 1e-19, np.array(1500.0), np.array(1e5), 10)
+    assert np.ndim(A) == 0 and not isinstance(A, np.ndarray)
+
+
+def test_beer_lambert_scalar_inputs():
+    X, sigma, T, P, L = 0.01, 1e-19, 1500.0, 1e5, 10
+    A = absorbance(X, sigma, T, P, L)
+
+    assert isinstance(A, float)
+    assert A == pytest.approx(absorbance(np.array([X]), sigma, T, P, L)[0], rel=1e-15)
+    assert species_mole_fraction(A, sigma, T, P, L) == pytest.approx(X, rel=1e-15)
+    assert absorption_cross_section(A, X, T, P, L) == pytest.approx(sigma, rel=1e-15)
+
+
+def test_beer_lambert_list_inputs():
+    X = [0.01, 0.02]
+    sigma = [1e-19, 2e-19]
+    expected = absorbance(np.array(X), np.array(sigma), 1500, 1e5, 10)
+
+    np.testing.assert_array_equal(
+        absorbance(X, np.array(sigma), 1500, 1e5, 10), expected
+    )
+    np.testing.assert_array_equal(
+        absorbance(np.array(X), sigma, 1500, 1e5, 10), expected
+    )
+    np.testing.assert_allclose(
+        species_mole_fraction(list(expected), sigma, 1500, [1e5, 1e5], 10), X
+    )
+    np.testing.assert_allclose(
+        absorption_cross_section(list(expected), X, [1500, 1500], 1e5, 10), sigma
+    )
+
+
+def cross_sections(rng, shape):
+    """Well-conditioned cross-sections with each species dominating one wavelength."""
+    N = shape[0]
+    sigma = rng.random(shape) * 2e-20
+    sigma[np.arange(N), np.arange(N)] += 1e-19
+    return sigma
+
+
+def per_step_solve(A, sigma, T, P, L):
+    """Reference solution solving the Beer-Lambert system separately at each time step."""
+    X = np.empty_like(A)
+    for i in range(A.shape[1]):
+        sigma_i = sigma[..., i] if sigma.ndim == 3 else sigma
+        X[:, i] = np.linalg.solve(sigma_i * absorbance(1, 1, T[i], P[i], L), A[:, i])
+    return X
+
+
+@pytest.mark.parametrize("N", [2, 3, 4, 5])
+@pytest.mark.parametrize("time_varying_sigma", [False, True])
+def test_multi_species_mole_fraction_time_history(N, time_varying_sigma):
+    rng = np.random.default_rng(N)
+    n_t = 100
+    L = 10
+
+    sigma = cross_sections(rng, (N, N, n_t) if time_varying_sigma else (N, N))
+    T = 1000 + 500 * rng.random(n_t)
+    P = 1e5 + 1e6 * rng.random(n_t)
+    A = rng.random((N, n_t))
+
+    X = multi_species_mole_fraction(A, sigma, T, P, L)
+
+    assert X.shape == (N, n_t)
+    assert X.flags.c_contiguous
+    np.testing.assert_allclose(X, per_step_solve(A, sigma, T, P, L), rtol=1e-10)
+
+
+@pytest.mark.parametrize("N", [2, 3])
+@pytest.mark.parametrize("time_varying_sigma", [False, True])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_multi_species_mole_fraction_preserves_dtype(N, time_varying_sigma, dtype):
+    rng = np.random.default_rng(N)
+    n_t = 10
+    sigma = cross_sections(rng, (N, N, n_t) if time_varying_sigma else (N, N)).astype(
+        dtype
+    )
+    A = rng.random((N, n_t)).astype(dtype)
+    T = np.full(n_t, 1500, dtype=dtype)
+
+    assert multi_species_mole_fraction(A, sigma, T, dtype(1e5), 10).dtype == dtype
+
+
+@pytest.mark.parametrize("N", [2, 3, 4])
+def test_multi_species_mole_fraction_single(N):
+    rng = np.random.default_rng(N)
+    sigma = cross_sections(rng, (N, N))
+    X_true = rng.random(N) * 0.01
+    A = sigma @ X_true * absorbance(1, 1, 1500, 1e5, 10)
+
+    X = multi_species_mole_fraction(A, sigma, 1500, 1e5, 10)
+
+    assert X.shape == (N,)
+    np.testing.assert_allclose(X, X_true, rtol=1e-10)
+
+
+@pytest.mark.parametrize("overlap", [1e-1, 1e-3, 1e-5])
+def test_multi_species_mole_fraction_ill_conditioned(overlap):
+    # Nearly identical spectra for both species give ill-conditioned cross-section matrices; only the
+    # two-species closed form differs from the LU factorization used as the reference
+    N = 2
+    rng = np.random.default_rng(N)
+    n_t = 1000
+    sigma = (1 + overlap * rng.standard_normal((N, N, n_t))) * 1e-19
+    X_true = rng.random((N, n_t))
+    A = np.einsum("ijt,jt->it", sigma, X_true) * absorbance(1, 1, 1500, 1e5, 10)
+
+    X = multi_species_mole_fraction(A, sigma, 1500, 1e5, 10)
+    X_ref = per_step_solve(A, sigma, np.full(n_t, 1500), np.full(n_t, 1e5), 10)
+
+    error = np.abs(X - X_true).max()
+    error_ref = np.abs(X_ref - X_true).max()
+    assert error <= 10 * error_ref + 1e-14
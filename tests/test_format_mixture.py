@@ -0,0 +1,34 @@
+import pytest
+
+from knightshock import format_mixture
+
+
+@pytest.mark.parametrize(
+    "mixture, expected",
+    [
+        ("CH4:1, O2:2, AR:20", {"CH4": 1.0, "O2": 2.0, "AR": 20.0}),
+        ("{ch4: 0.05, o2: 0.1, ar: 0.85}", {"CH4": 0.05, "O2": 0.1, "AR": 0.85}),
+        ("N-C7H16:1e-3,CH2(S):0.5", {"N-C7H16": 0.001, "CH2(S)": 0.5}),
+        (" C2H4 : 1.5E-2 ,  AR:0.985 ", {"C2H4": 0.015, "AR": 0.985}),
+        ("  ar ", {"AR": 1.0}),
+        ("C2H4 A:1, AR:2", {"C2H4 A": 1.0, "AR": 2.0}),
+        ({"ch4 ": 1, "o2": "2"}, {"CH4": 1.0, "O2": 2.0}),
+    ],
+)
+def test_format_mixture(mixture, expected):
+    assert format_mixture(mixture) == expected
+
+
+@pytest.mark.parametrize(
+    "mixture",
+    [
+        "CH4:1 O2:2",
+        "CH4:1, O2:2,",
+        "O2:1,,N2:3",
+        "CH4:x",
+        "H2:1:2",
+    ],
+)
+def test_format_mixture_invalid(mixture):
+    with pytest.raises(ValueError):
+        format_mixture(mixture)
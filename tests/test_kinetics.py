@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from knightshock.kinetics import Simulation
+
+
+@pytest.fixture(scope="module")
+def sim():
+    return Simulation("gri30.yaml", 1600, 5e5, "CH4:1, O2:2, AR:20").run(t=1e-3)
+
+
+def test_history_returns_copies(sim):
+    T = sim.T
+    T -= 273.15
+    np.testing.assert_array_equal(sim.T, sim.states.T)
+    np.testing.assert_allclose(T, sim.T - 273.15)
+    for x in (sim.t, sim.T, sim.P):
+        assert x.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "t, dt, expected",
+    [
+        (1e-3, 2.5e-4, [0, 2.5e-4, 5e-4, 7.5e-4, 1e-3]),
+        (1e-3, 3e-4, [0, 3e-4, 6e-4, 9e-4, 1e-3]),
+        (1e-3, 1e-4, np.arange(11) * 1e-4),
+    ],
+)
+def test_run_fixed_interval(t, dt, expected):
+    sim = Simulation("gri30.yaml", 1600, 5e5, "CH4:1, O2:2, AR:20").run(t=t, dt=dt)
+    np.testing.assert_allclose(sim.t, expected, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("dt", [0, -1e-4])
+def test_run_invalid_dt(dt):
+    sim = Simulation("gri30.yaml", 1600, 5e5, "CH4:1, O2:2, AR:20")
+    with pytest.raises(ValueError):
+        sim.run(t=1e-3, dt=dt)
+
+
+def test_capture_scalars(sim):
+    sim_scalars = Simulation(
+        "gri30.yaml", 1600, 5e5, "CH4:1, O2:2, AR:20", capture="scalars"
+    ).run(t=1e-3)
+
+    assert "Y" not in sim_scalars._history
+    assert not hasattr(sim_scalars, "states")
+    np.testing.assert_array_equal(sim_scalars.t, sim.t)
+    np.testing.assert_array_equal(sim_scalars.T, sim.T)
+    np.testing.assert_array_equal(sim_scalars.P, sim.P)
+    assert sim_scalars.ignition_delay_time() == sim.ignition_delay_time()
+    assert sim_scalars.ignition_delay_time(method="peak") == sim.ignition_delay_time(
+        method="peak"
+    )
+
+    with pytest.raises(AttributeError):
+        sim_scalars.X("OH")
+    with pytest.raises(AttributeError):
+        sim_scalars.get_top_species(5)
+    with pytest.raises(AttributeError):
+        sim_scalars.ignition_delay_time("OH")
+
+
+def test_capture_invalid():
+    with pytest.raises(ValueError):
+        Simulation("gri30.yaml", 1600, 5e5, "CH4:1, O2:2, AR:20", capture="none")
+
+
+def ranked_species(sim):
+    """Reference ranking of all species by maximum mole fraction, computed without the cache."""
+    X_max = sim.states.X.max(axis=0)
+    return [sim.states.species_names[i] for i in np.argsort(-X_max, kind="stable")]
+
+
+def test_get_top_species_cache():
+    sim = Simulation("gri30.yaml", 1600, 5e5, "CH4:1, O2:2, AR:20").run(t=1e-5)
+    before = ranked_species(sim)
+
+    assert sim.get_top_species() == before
+    assert sim._species_rank is not None
+    assert sim.get_top_species(3) == before[:3]
+    assert sim.get_top_species(3, exclude="ar") == [s for s in before if s != "AR"][:3]
+    assert sim.get_top_species(exclude=["AR", "o2"]) == [
+        s for s in before if s not in ("AR", "O2")
+    ]
+    assert sim.get_top_species() == before
+
+    sim.run(t=1e-3)
+    assert sim._species_rank is None
+    after = ranked_species(sim)
+    assert after != before
+    assert sim.get_top_species() == after
+    assert sim.get_top_species(5, exclude="AR") == [s for s in after if s != "AR"][:5]